@@ -2,21 +2,39 @@ import numpy as np
 
 
 def mask_adjacency_array(mask, adjacency_array):
-    # Find the indices that have been asked to be removed
-    indices_to_remove = np.nonzero(~mask)[0]
-    # Set intersection to find any rows containing those elements,
-    # reshape back in to the same size as adjacency array
-    entries_to_remove = np.in1d(adjacency_array, indices_to_remove)
-    entries_to_remove = entries_to_remove.reshape([-1, adjacency_array.shape[1]])
-    # Only keep those entries that are not flagged for removal
-    indices_to_keep = ~entries_to_remove.any(axis=1)
-    return adjacency_array[indices_to_keep, :]
+    # Index the boolean mask directly with the adjacency array - a row is
+    # only kept if every index in it is True in the mask. This avoids the
+    # sort that a set intersection would require, although the gathered
+    # (n_rows, n_cols) temporary is as large as the one np.in1d returned.
+    # The rows are reduced as bytes, as the bitwise_and ufunc loop is
+    # vectorised whereas the generic all() reduction is not.
+    byte_mask = mask.astype(bool, copy=False).view(np.uint8)
+    row_bytes = byte_mask[adjacency_array]
+    indices_to_keep = np.bitwise_and.reduce(row_bytes, axis=1).view(bool)
+    return adjacency_array.take(np.flatnonzero(indices_to_keep), axis=0)
 
 
 def reindex_adjacency_array(adjacency_array):
-    remap_vector = np.arange(np.max(adjacency_array) + 1)
-    unique_values = np.unique(adjacency_array)
-    remap_vector[unique_values] = np.arange(unique_values.shape[0])
+    # Mark every index that is used - the running count of used indices is
+    # then the new index of each used index, so the reindexing needs no sort
+    used_mask = np.zeros(np.max(adjacency_array) + 1, dtype=bool)
+    used_mask[adjacency_array] = True
+    remap_vector = np.cumsum(used_mask) - 1
 
     # Apply the mask
     return remap_vector[adjacency_array]
+
+
+def mask_and_reindex_adjacency_array(mask, adjacency_array):
+    # Only keep the rows where every index is True in the mask
+    masked_adj = mask_adjacency_array(mask, adjacency_array)
+    # Rebuild the mask from the indices that are actually still referenced,
+    # which drops any that were kept but are now isolated
+    kept_mask = np.zeros(mask.shape[0], dtype=bool)
+    kept_mask[masked_adj] = True
+    # The running count of kept indices is the new index of each kept index,
+    # so the reindexing needs no sort
+    remap_vector = np.cumsum(kept_mask) - 1
+    # Return the kept indices rather than the mask so that callers can share
+    # them across every gather (take is faster than boolean indexing)
+    return np.flatnonzero(kept_mask), remap_vector[masked_adj]
@@ -5,7 +5,7 @@ import numpy as np
 
 from .normals import compute_face_normals, compute_vertex_normals
 from .. import PointCloud
-from ..adjacency import mask_adjacency_array, reindex_adjacency_array
+from ..adjacency import mask_and_reindex_adjacency_array
 
 
 def grid_tcoords(shape):
@@ -86,10 +86,9 @@ def subsampled_grid_triangulation(shape, subsampling=1):
     trilist : ``(M, 3)`` `ndarray`
         The triangle list created on an implicit regular grid.
     """
-    # Quickly create the indices in a grid
-    indices_grid = np.zeros(shape)
-    flat_vals_grid = indices_grid.ravel()
-    flat_vals_grid[:] = np.arange(np.prod(shape))
+    # Quickly create the indices in a grid - reshaping the range directly avoids
+    # allocating (and casting through) a separate float grid
+    indices_grid = np.arange(np.prod(shape)).reshape(shape)
 
     # Subsample the grid if necessary - useful for making very dense grids
     # much sparser
@@ -118,6 +117,20 @@ def subsampled_grid_triangulation(shape, subsampling=1):
     return np.vstack([tri_down_left, tri_up_right]).astype(np.uint32)
 
 
+def _copy_without(obj, skip):
+    # Copy obj as Copyable.copy does, but leave out the attributes in skip.
+    # Used when those attributes are about to be replaced, so that they are
+    # not copied only to be thrown away.
+    new = obj.__class__.__new__(obj.__class__)
+    for k, v in obj.__dict__.items():
+        if k not in skip:
+            try:
+                new.__dict__[k] = v.copy()
+            except AttributeError:
+                new.__dict__[k] = v
+    return new
+
+
 class TriMesh(PointCloud):
     r"""
     A :map:`PointCloud` with a connectivity defined by a triangle list. These
@@ -129,7 +142,8 @@ class TriMesh(PointCloud):
         The array representing the points.
     trilist : ``(M, 3)`` `ndarray` or ``None``, optional
         The triangle list. If `None`, a Delaunay triangulation of
-        the points will be used instead.
+        the points will be used instead. The trilist is always stored
+        C-contiguous.
     copy: `bool`, optional
         If ``False``, the points will not be copied on assignment.
         Any trilist will also not be copied.
@@ -224,9 +238,36 @@ class TriMesh(PointCloud):
             copy=False,
         )
 
+    def __setstate__(self, state):
+        # Meshes pickled before the trilist became a property stored it
+        # directly on the instance
+        if "trilist" in state:
+            trilist = state.pop("trilist")
+            state["_trilist"] = trilist
+            state["_n_tris"] = trilist.shape[0]
+        self.__dict__ = state
+
     def __str__(self):
         return "{}, n_tris: {}".format(PointCloud.__str__(self), self.n_tris)
 
+    @property
+    def trilist(self):
+        r"""
+        The triangle list. This is always C-contiguous so that it can be passed
+        to compiled code without being copied.
+
+        :type: ``(n_tris, 3)`` `ndarray`
+        """
+        return self._trilist
+
+    @trilist.setter
+    def trilist(self, value):
+        # No-op for C-contiguous arrays, otherwise a single C-ordered copy
+        value = np.require(value, requirements=["C"])
+        self._trilist = value
+        # Cache the number of triangles so it is not recomputed on every access
+        self._n_tris = value.shape[0]
+
     @property
     def n_tris(self):
         r"""
@@ -234,7 +275,7 @@ class TriMesh(PointCloud):
 
         :type: `int`
         """
-        return len(self.trilist)
+        return self._n_tris
 
     def tojson(self):
         r"""
@@ -269,23 +310,32 @@ class TriMesh(PointCloud):
         mesh : :map:`TriMesh`
             A new mesh that has been masked.
         """
-        if mask.shape[0] != self.n_points:
+        n_mask = mask.shape[0]
+        n_points = self.n_points
+        if n_mask != n_points:
             raise ValueError(
                 "Mask must be a 1D boolean array of the same "
-                "number of entries as points in this TriMesh."
+                "number of entries as points in this TriMesh "
+                "(got {}, expected {}).".format(n_mask, n_points)
             )
 
-        tm = self.copy()
         if np.all(mask):  # Fast path for all true
-            return tm
+            return self.copy()
         else:
-            # Recalculate the mask to remove isolated vertices
-            isolated_mask = self._isolated_mask(mask)
-            # Recreate the adjacency array with the updated mask
-            masked_adj = mask_adjacency_array(isolated_mask, self.trilist)
-            tm.trilist = reindex_adjacency_array(masked_adj)
-            tm.points = tm.points[isolated_mask, :]
-            return tm
+            # Mask and reindex the trilist in one pass, recalculating the
+            # mask to remove isolated vertices
+            kept_indices, trilist = mask_and_reindex_adjacency_array(mask, self.trilist)
+            points = self.points.take(kept_indices, axis=0)
+            return self._masked_copy(points, trilist)
+
+    def _masked_copy(self, points, trilist, skip=()):
+        # Masking already creates new points and a new trilist, so copy
+        # everything else (keeping the type and any extra state of self) but
+        # never copy them, or any attribute in skip, which the caller then sets
+        tm = _copy_without(self, {"points", "_trilist", "_n_tris"}.union(skip))
+        tm.points = points
+        tm.trilist = trilist
+        return tm
 
     def from_tri_mask(self, tri_mask):
         """
@@ -307,23 +357,11 @@ class TriMesh(PointCloud):
         # start with an all False point mask.
         point_mask = np.zeros(self.n_points, dtype=np.bool)
         # find all points that are involved in the triangles we wish to
-        # retain and set their mask to True.
-        point_mask[np.unique(self.trilist[tri_mask].ravel())] = True
+        # retain and set their mask to True (repeated points are harmless, so
+        # there is no need to find the unique points first).
+        point_mask[self.trilist[tri_mask]] = True
         return self.from_mask(point_mask)
 
-    def _isolated_mask(self, mask):
-        # Find the triangles we need to keep
-        masked_adj = mask_adjacency_array(mask, self.trilist)
-        # Find isolated vertices (vertices that don't exist in valid
-        # triangles)
-        isolated_indices = np.setdiff1d(np.nonzero(mask)[0], masked_adj)
-
-        # Create a 'new mask' that contains the points the use asked
-        # for MINUS the points that we can't create triangles for
-        new_mask = mask.copy()
-        new_mask[isolated_indices] = False
-        return new_mask
-
     def as_pointgraph(self, copy=True, skip_checks=False):
         """
         Converts the TriMesh to a :map:`PointUndirectedGraph`.
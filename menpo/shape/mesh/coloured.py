@@ -1,6 +1,6 @@
 import numpy as np
 
-from ..adjacency import mask_adjacency_array, reindex_adjacency_array
+from ..adjacency import mask_and_reindex_adjacency_array
 from .base import TriMesh
 
 
@@ -34,8 +34,8 @@ class ColouredTriMesh(TriMesh):
         # Handle the settings of colours, either be provided a default grey
         # set of colours, or copy the given array if necessary
         if colours is None:
-            # default to grey
-            colours_handle = np.ones_like(points, dtype=np.float) * 0.5
+            # default to grey, filled in place to avoid a temporary array
+            colours_handle = np.full_like(points, 0.5, dtype=np.float64)
         elif not copy:
             colours_handle = colours
         else:
@@ -153,24 +153,25 @@ class ColouredTriMesh(TriMesh):
         mesh : :map:`ColouredTriMesh`
             A new mesh that has been masked.
         """
-        if mask.shape[0] != self.n_points:
+        n_mask = mask.shape[0]
+        n_points = self.n_points
+        if n_mask != n_points:
             raise ValueError(
                 "Mask must be a 1D boolean array of the same "
-                "number of entries as points in this "
-                "ColouredTriMesh."
+                "number of entries as points in this ColouredTriMesh "
+                "(got {}, expected {}).".format(n_mask, n_points)
             )
 
-        ctm = self.copy()
         if np.all(mask):  # Fast path for all true
-            return ctm
+            return self.copy()
         else:
-            # Recalculate the mask to remove isolated vertices
-            isolated_mask = self._isolated_mask(mask)
-            # Recreate the adjacency array with the updated mask
-            masked_adj = mask_adjacency_array(isolated_mask, self.trilist)
-            ctm.trilist = reindex_adjacency_array(masked_adj)
-            ctm.points = ctm.points[isolated_mask, :]
-            ctm.colours = ctm.colours[isolated_mask, :]
+            # Mask and reindex the trilist in one pass, recalculating the
+            # mask to remove isolated vertices
+            kept_indices, trilist = mask_and_reindex_adjacency_array(mask, self.trilist)
+            points = self.points.take(kept_indices, axis=0)
+            colours = self.colours.take(kept_indices, axis=0)
+            ctm = self._masked_copy(points, trilist, skip=("colours",))
+            ctm.colours = colours
             return ctm
 
     def clip_texture(self, range=(0.0, 1.0)):
@@ -2,9 +2,10 @@ import warnings
 
 import numpy as np
 from numpy.testing import assert_allclose
+from pytest import raises
 
 from menpo.image import Image, MaskedImage
-from menpo.shape import TriMesh, TexturedTriMesh, ColouredTriMesh
+from menpo.shape import PointCloud, TriMesh, TexturedTriMesh, ColouredTriMesh
 from menpo.testing import is_same_array
 
 
@@ -176,6 +177,115 @@ def test_texturedtrimesh_creation_copy_true():
     assert not is_same_array(ttm.texture.pixels, pixels)
 
 
+def test_texturedtrimesh_from_mask():
+    points = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]])
+    trilist = np.array([[0, 1, 3], [1, 2, 3]])
+    tcoords = np.array([[0, 0], [1, 0], [1, 1], [0, 1]])
+    texture = Image(np.ones([10, 10]), copy=False)
+    ttm = TexturedTriMesh(points, tcoords, texture, trilist=trilist)
+    ttm.landmarks["test"] = PointCloud(np.ones([3, 3]))
+    mask = np.array([False, True, True, True])
+    masked_ttm = ttm.from_mask(mask)
+    assert masked_ttm.n_tris == 1
+    assert_allclose(masked_ttm.points, points[1:])
+    assert_allclose(masked_ttm.tcoords.points, tcoords[1:])
+    assert_allclose(masked_ttm.trilist, [[0, 1, 2]])
+    assert not is_same_array(masked_ttm.texture.pixels, ttm.texture.pixels)
+    assert "test" in masked_ttm.landmarks
+
+
+def test_texturedtrimesh_from_mask_wrong_size_raises():
+    points = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]])
+    trilist = np.array([[0, 1, 3], [1, 2, 3]])
+    tcoords = np.array([[0, 0], [1, 0], [1, 1], [0, 1]])
+    texture = Image(np.ones([10, 10]), copy=False)
+    ttm = TexturedTriMesh(points, tcoords, texture, trilist=trilist)
+    with raises(ValueError, match=r"TexturedTriMesh \(got 3, expected 4\)"):
+        ttm.from_mask(np.ones(3, dtype=bool))
+
+
+def test_texturedtrimesh_from_mask_keeps_extra_state():
+    points = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]])
+    trilist = np.array([[0, 1, 3], [1, 2, 3]])
+    tcoords = np.array([[0, 0], [1, 0], [1, 1], [0, 1]])
+    texture = Image(np.ones([10, 10]), copy=False)
+    ttm = TexturedTriMesh(points, tcoords, texture, trilist=trilist)
+    ttm.extra = "extra"
+    ttm.tcoords.landmarks["test"] = PointCloud(np.ones([3, 2]))
+    masked_ttm = ttm.from_mask(np.array([False, True, True, True]))
+    assert type(masked_ttm) is TexturedTriMesh
+    assert masked_ttm.extra == "extra"
+    assert "test" in masked_ttm.tcoords.landmarks
+    assert_allclose(masked_ttm.tcoords.points, tcoords[1:])
+    assert_allclose(ttm.tcoords.points, tcoords)
+
+
+def test_texturedtrimesh_from_mask_subclass():
+    class TexturedTriMeshSubclass(TexturedTriMesh):
+        pass
+
+    points = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]])
+    trilist = np.array([[0, 1, 3], [1, 2, 3]])
+    tcoords = np.array([[0, 0], [1, 0], [1, 1], [0, 1]])
+    texture = Image(np.ones([10, 10]), copy=False)
+    ttm = TexturedTriMeshSubclass(points, tcoords, texture, trilist=trilist)
+    ttm.extra = "extra"
+    masked_ttm = ttm.from_mask(np.array([False, True, True, True]))
+    assert type(masked_ttm) is TexturedTriMeshSubclass
+    assert masked_ttm.extra == "extra"
+    assert_allclose(masked_ttm.points, points[1:])
+    assert_allclose(masked_ttm.tcoords.points, tcoords[1:])
+    assert_allclose(masked_ttm.trilist, [[0, 1, 2]])
+
+
+def test_colouredtrimesh_from_mask():
+    points = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]])
+    trilist = np.array([[0, 1, 3], [1, 2, 3]])
+    colours = np.random.uniform(size=(4, 3))
+    ctm = ColouredTriMesh(points, trilist=trilist, colours=colours)
+    ctm.landmarks["test"] = PointCloud(np.ones([3, 3]))
+    mask = np.array([False, True, True, True])
+    masked_ctm = ctm.from_mask(mask)
+    assert masked_ctm.n_tris == 1
+    assert_allclose(masked_ctm.points, points[1:])
+    assert_allclose(masked_ctm.colours, colours[1:])
+    assert_allclose(masked_ctm.trilist, [[0, 1, 2]])
+    assert "test" in masked_ctm.landmarks
+
+
+def test_colouredtrimesh_from_mask_wrong_size_raises():
+    points = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]])
+    trilist = np.array([[0, 1, 3], [1, 2, 3]])
+    ctm = ColouredTriMesh(points, trilist=trilist)
+    with raises(ValueError, match=r"ColouredTriMesh \(got 3, expected 4\)"):
+        ctm.from_mask(np.ones(3, dtype=bool))
+
+
+def test_colouredtrimesh_from_mask_subclass():
+    class ColouredTriMeshSubclass(ColouredTriMesh):
+        pass
+
+    points = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]])
+    trilist = np.array([[0, 1, 3], [1, 2, 3]])
+    colours = np.random.uniform(size=(4, 3))
+    ctm = ColouredTriMeshSubclass(points, trilist=trilist, colours=colours)
+    ctm.extra = "extra"
+    masked_ctm = ctm.from_mask(np.array([False, True, True, True]))
+    assert type(masked_ctm) is ColouredTriMeshSubclass
+    assert masked_ctm.extra == "extra"
+    assert_allclose(masked_ctm.points, points[1:])
+    assert_allclose(masked_ctm.colours, colours[1:])
+    assert_allclose(masked_ctm.trilist, [[0, 1, 2]])
+
+
+def test_colouredtrimesh_default_colours():
+    points = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]])
+    trilist = np.array([[0, 1, 3], [1, 2, 3]])
+    ctm = ColouredTriMesh(points, trilist=trilist)
+    assert ctm.colours.dtype == np.float64
+    assert_allclose(ctm.colours, np.full((4, 3), 0.5))
+
+
 def test_colouredtrimesh_creation_copy_false():
     points = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]])
     trilist = np.array([[0, 1, 3], [1, 2, 3]])
@@ -226,6 +336,93 @@ def test_trimesh_n_tris():
     assert trimesh.n_tris == 2
 
 
+def test_trimesh_n_tris_trilist_assignment():
+    points = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]])
+    trilist = np.array([[0, 1, 3], [1, 2, 3]])
+    trimesh = TriMesh(points, trilist=trilist)
+    trimesh.trilist = trilist[:1]
+    assert trimesh.n_tris == 1
+
+
+def test_trimesh_trilist_assignment_c_contiguous():
+    points = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]])
+    trilist = np.array([[0, 1, 3], [1, 2, 3]])
+    trimesh = TriMesh(points, trilist=trilist)
+    trimesh.trilist = np.array([[0, 1, 3], [1, 2, 3]], order="F")
+    assert trimesh.trilist.flags.c_contiguous
+    assert_allclose(trimesh.trilist, trilist)
+
+
+def test_trimesh_setstate_legacy_trilist():
+    points = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]])
+    trilist = np.array([[0, 1, 3], [1, 2, 3]])
+    trimesh = TriMesh(points, trilist=trilist)
+    state = dict(trimesh.__dict__)
+    state["trilist"] = state.pop("_trilist")
+    del state["_n_tris"]
+    new_trimesh = TriMesh.__new__(TriMesh)
+    new_trimesh.__setstate__(state)
+    assert new_trimesh.n_tris == 2
+    assert_allclose(new_trimesh.trilist, trilist)
+
+
+def test_trimesh_from_mask():
+    points = np.array([[0, 0], [1, 0], [1, 1], [2, 0], [2, 1]])
+    trilist = np.array([[0, 1, 2], [1, 3, 2], [2, 3, 4]])
+    mask = np.array([False, True, True, True, False])
+    trimesh = TriMesh(points, trilist=trilist).from_mask(mask)
+    assert trimesh.n_tris == 1
+    assert trimesh.n_points == 3
+    assert_allclose(trimesh.points, points[1:4])
+    assert_allclose(trimesh.trilist, [[0, 2, 1]])
+
+
+def test_trimesh_from_mask_wrong_size_raises():
+    points = np.array([[0, 0], [1, 0], [1, 1], [2, 0], [2, 1]])
+    trilist = np.array([[0, 1, 2], [1, 3, 2], [2, 3, 4]])
+    with raises(ValueError, match=r"got 4, expected 5"):
+        TriMesh(points, trilist=trilist).from_mask(np.ones(4, dtype=bool))
+
+
+def test_trimesh_from_mask_removes_isolated_points():
+    points = np.array([[0, 0], [1, 0], [1, 1], [2, 0], [2, 1]])
+    trilist = np.array([[0, 1, 2], [1, 3, 2], [2, 3, 4]])
+    mask = np.array([True, True, True, False, True])
+    trimesh = TriMesh(points, trilist=trilist).from_mask(mask)
+    assert trimesh.n_tris == 1
+    assert trimesh.n_points == 3
+    assert_allclose(trimesh.points, points[:3])
+    assert_allclose(trimesh.trilist, [[0, 1, 2]])
+
+
+def test_trimesh_from_mask_keeps_extra_attributes():
+    points = np.array([[0, 0], [1, 0], [1, 1], [2, 0], [2, 1]])
+    trilist = np.array([[0, 1, 2], [1, 3, 2], [2, 3, 4]])
+    trimesh = TriMesh(points, trilist=trilist)
+    trimesh.extra = "extra"
+    masked = trimesh.from_mask(np.array([False, True, True, True, False]))
+    assert type(masked) is TriMesh
+    assert masked.extra == "extra"
+    assert masked.n_tris == 1
+    assert_allclose(masked.points, points[1:4])
+    assert_allclose(masked.trilist, [[0, 2, 1]])
+
+
+def test_trimesh_from_mask_subclass():
+    class TriMeshSubclass(TriMesh):
+        pass
+
+    points = np.array([[0, 0], [1, 0], [1, 1], [2, 0], [2, 1]])
+    trilist = np.array([[0, 1, 2], [1, 3, 2], [2, 3, 4]])
+    trimesh = TriMeshSubclass(points, trilist=trilist)
+    trimesh.extra = "extra"
+    masked = trimesh.from_mask(np.array([False, True, True, True, False]))
+    assert type(masked) is TriMeshSubclass
+    assert masked.extra == "extra"
+    assert_allclose(masked.points, points[1:4])
+    assert_allclose(masked.trilist, [[0, 2, 1]])
+
+
 def test_trimesh_from_tri_mask():
     points = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]])
     trilist = np.array([[0, 1, 3], [1, 2, 3]])
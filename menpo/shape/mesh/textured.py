@@ -3,8 +3,8 @@ import numpy as np
 from menpo.shape import PointCloud
 from menpo.transform import tcoords_to_image_coords
 
-from ..adjacency import mask_adjacency_array, reindex_adjacency_array
-from .base import TriMesh, grid_tcoords
+from ..adjacency import mask_and_reindex_adjacency_array
+from .base import TriMesh, _copy_without, grid_tcoords
 
 
 class TexturedTriMesh(TriMesh):
@@ -214,24 +214,28 @@ class TexturedTriMesh(TriMesh):
         mesh : :map:`TexturedTriMesh`
             A new mesh that has been masked.
         """
-        if mask.shape[0] != self.n_points:
+        n_mask = mask.shape[0]
+        n_points = self.n_points
+        if n_mask != n_points:
             raise ValueError(
                 "Mask must be a 1D boolean array of the same "
-                "number of entries as points in this "
-                "TexturedTriMesh."
+                "number of entries as points in this TexturedTriMesh "
+                "(got {}, expected {}).".format(n_mask, n_points)
             )
 
-        ttm = self.copy()
         if np.all(mask):  # Fast path for all true
-            return ttm
+            return self.copy()
         else:
-            # Recalculate the mask to remove isolated vertices
-            isolated_mask = self._isolated_mask(mask)
-            # Recreate the adjacency array with the updated mask
-            masked_adj = mask_adjacency_array(isolated_mask, self.trilist)
-            ttm.trilist = reindex_adjacency_array(masked_adj)
-            ttm.points = ttm.points[isolated_mask, :]
-            ttm.tcoords.points = ttm.tcoords.points[isolated_mask, :]
+            # Mask and reindex the trilist in one pass, recalculating the
+            # mask to remove isolated vertices
+            kept_indices, trilist = mask_and_reindex_adjacency_array(mask, self.trilist)
+            points = self.points.take(kept_indices, axis=0)
+            tcoords = self.tcoords.points.take(kept_indices, axis=0)
+            ttm = self._masked_copy(points, trilist, skip=("tcoords",))
+            # Keep any state on the tcoords PointCloud (e.g. its landmarks)
+            # without copying the tcoords points that masking has replaced
+            ttm.tcoords = _copy_without(self.tcoords, {"points"})
+            ttm.tcoords.points = tcoords
             return ttm
 
     def clip_texture(self, range=(0.0, 1.0)):
@@ -0,0 +1,30 @@
+import numpy as np
+from numpy.testing import assert_allclose
+
+from menpo.shape.adjacency import (
+    mask_adjacency_array,
+    mask_and_reindex_adjacency_array,
+    reindex_adjacency_array,
+)
+
+trilist = np.array([[0, 1, 2], [1, 3, 2], [2, 3, 4]])
+mask = np.array([False, True, True, True, True])
+
+
+def test_mask_adjacency_array():
+    assert_allclose(mask_adjacency_array(mask, trilist), [[1, 3, 2], [2, 3, 4]])
+
+
+def test_reindex_adjacency_array():
+    assert_allclose(
+        reindex_adjacency_array(np.array([[1, 3, 2], [2, 3, 4]])),
+        [[0, 2, 1], [1, 2, 3]],
+    )
+
+
+def test_mask_and_reindex_adjacency_array():
+    kept_indices, new_trilist = mask_and_reindex_adjacency_array(
+        np.array([True, True, True, False, True]), trilist
+    )
+    assert_allclose(kept_indices, [0, 1, 2])
+    assert_allclose(new_trilist, [[0, 1, 2]])
@@ -176,18 +176,26 @@ class Transform(Copyable):
         transformed : ``type(x)``
             The transformed object or array
         """
+        # Check the type explicitly rather than catching the AttributeError
+        # raised by arrays - raising and catching an exception is far more
+        # expensive than an isinstance check on this hot path. This also means
+        # any AttributeError raised whilst transforming is no longer swallowed.
+        if not isinstance(x, Transformable):
+            return self._apply_batched(x, batch_size, **kwargs)
 
-        def transform(x_):
-            """
-            Local closure which calls the :meth:`_apply` method with the
-            `kwargs` attached.
-            """
-            return self._apply_batched(x_, batch_size, **kwargs)
+        if batch_size is None and not kwargs:
+            # Nothing needs to be attached, so avoid building a closure
+            transform = self._apply
+        else:
 
-        try:
-            return x._transform(transform)
-        except AttributeError:
-            return self._apply_batched(x, batch_size, **kwargs)
+            def transform(x_):
+                """
+                Local closure which calls the :meth:`_apply` method with the
+                `kwargs` attached.
+                """
+                return self._apply_batched(x_, batch_size, **kwargs)
+
+        return x._transform(transform)
 
     def _apply_batched(self, x, batch_size, **kwargs):
         if batch_size is None:
@@ -5,6 +5,7 @@ from numpy.testing import assert_allclose
 from pytest import raises
 
 from menpo.transform import Transform
+from menpo.transform.base import Transformable
 
 x = np.zeros([5, 5])
 
@@ -35,7 +36,7 @@ def test_transform_apply_x_not_transformable():
 
 
 def test_transform_apply_x_transformable():
-    mocked = Mock()
+    mocked = Mock(spec=Transformable)
     mocked._transform.return_value = mocked
     tr = MockTransform()
     transformed_mock = tr.apply(mocked)
@@ -44,6 +45,16 @@ def test_transform_apply_x_transformable():
     assert mocked._transform.called
 
 
+def test_transform_apply_x_transformable_kwargs():
+    mocked = Mock(spec=Transformable)
+    mocked._transform.side_effect = lambda transform: transform(x)
+    tr = MockTransform()
+    tr._apply = Mock(return_value=x)
+    tr.apply(mocked, foo=1)
+
+    tr._apply.assert_called_once_with(x, foo=1)
+
+
 def test_transform_apply_inplace_x_transformable():
     mocked = Mock()
     mocked._transform_inplace.return_value = mocked